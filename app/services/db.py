@@ -6,6 +6,19 @@ from app.constants import TAG_ALIAS
 
 _COL_CACHE: dict[int, dict[str, set[str]]] = {}
 _JOIN_CACHE: dict[int, str | None] = {}
+# 검색 SQL은 (조인 형태, 텀 개수, limit/offset 유무)가 같으면 문자열도 같다.
+# 매 키 입력마다 문자열을 이어 붙이는 대신 모양별로 한 번만 만들어 재사용하면
+# sqlite3의 statement 캐시도 항상 같은 텍스트로 적중한다.
+_SQL_CACHE: dict[tuple, str] = {}
+# 커넥션별 card_search(FTS5) / card_view(비정규화 테이블) 존재 여부
+_FTS_CACHE: dict[int, bool] = {}
+_VIEW_CACHE: dict[int, bool] = {}
+
+_FTS_SUGGEST_SQL = (
+    "SELECT CAST(print_id AS INTEGER) AS print_id, card_number, name_ja, name_ko, image_url"
+    " FROM card_search WHERE card_search MATCH ? ORDER BY card_number"
+)
+_FTS_ANY_SQL = "SELECT 1 FROM card_search WHERE card_search MATCH ? LIMIT 1"
 _MISSING = object()
 _TOKEN_SPLIT_RE = re.compile(r"[\s,|/]+")
 
@@ -26,12 +39,30 @@ def ensure_db(path: str) -> bool:
     return True
 
 
+def apply_perf_pragmas(conn: sqlite3.Connection) -> None:
+    """읽기 위주 워크로드용 프라그마. WAL이면 갱신 중에도 검색이 안 막힌다."""
+    # 네트워크 FS 등에서 일부 프라그마가 실패할 수 있어 개별 적용.
+    for pragma in (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-20000",
+    ):
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            pass
+
+
 def open_db(path: str) -> sqlite3.Connection:
     if not path or not path.strip():
         raise ValueError("DB path is empty")
     ensure_db(path)
-    conn = sqlite3.connect(path)
+    # cached_statements 기본값(128)보다 넉넉히: 검색 SQL 변형이 많다.
+    conn = sqlite3.connect(path, cached_statements=256, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    apply_perf_pragmas(conn)
     return conn
 
 
@@ -43,6 +74,8 @@ def clear_conn_cache(conn: sqlite3.Connection) -> None:
     key = _conn_key(conn)
     _COL_CACHE.pop(key, None)
     _JOIN_CACHE.pop(key, None)
+    _FTS_CACHE.pop(key, None)
+    _VIEW_CACHE.pop(key, None)
 
 def _normalize_term(text: str) -> str:
     out = (text or "").strip().lower()
@@ -149,7 +182,36 @@ def _build_tag_joins(conn: sqlite3.Connection) -> str | None:
     _JOIN_CACHE[key] = None
     return None
 
-def query_suggest(conn: sqlite3.Connection, q: str, limit: int | None = None) -> list[dict]:
+def _has_search_index(conn: sqlite3.Connection) -> bool:
+    key = _conn_key(conn)
+    cached = _FTS_CACHE.get(key)
+    if cached is None:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='card_search'"
+        ).fetchone()
+        cached = bool(row)
+        _FTS_CACHE[key] = cached
+    return cached
+
+
+def _fts_match_expr(q: str, terms: list[str]) -> str:
+    # trigram 토크나이저는 3글자 미만 질의를 못 받으므로 짧은 텀은 버린다.
+    parts: dict[str, None] = {}
+    for term in (q, *terms):
+        term = term.strip()
+        if len(term) >= 3:
+            parts['"' + term.replace('"', '""') + '"'] = None
+    return " OR ".join(parts)
+
+
+def _tuple_rows(cur: sqlite3.Cursor) -> list[tuple]:
+    # 검색 결과는 키 입력마다 만들어지므로 Row→dict 변환을 생략하고
+    # (print_id, card_number, name_ja, name_ko, image_url) 튜플 그대로 반환.
+    cur.row_factory = None
+    return cur.fetchall()
+
+
+def query_suggest(conn: sqlite3.Connection, q: str, limit: int | None = None, offset: int = 0) -> list[tuple]:
     q = (q or "").strip()
     if not q:
         return []
@@ -158,47 +220,83 @@ def query_suggest(conn: sqlite3.Connection, q: str, limit: int | None = None) ->
     terms = _build_search_terms(q)
     normalized_terms = _unique_terms([_normalize_term(term) for term in terms])
 
+    # 갱신 파이프라인이 구워 둔 FTS5 trigram 인덱스가 있으면 MATCH로 즉답.
+    # 결과가 없거나(짧은 질의 포함) 인덱스가 깨졌으면 기존 LIKE 스캔으로 넘어간다.
+    if _has_search_index(conn):
+        match = _fts_match_expr(q, terms)
+        if match:
+            sql = _FTS_SUGGEST_SQL
+            params: list[object] = [match]
+            if limit is not None and limit > 0:
+                sql += " LIMIT ?"
+                params.append(limit)
+                if offset > 0:
+                    sql += " OFFSET ?"
+                    params.append(offset)
+            try:
+                rows = _tuple_rows(conn.execute(sql, params))
+                if rows:
+                    return rows
+                # 페이지 이어 붙이기(offset>0) 중에 FTS가 바닥난 경우, 0페이지를
+                # FTS가 채웠다면 LIKE로 넘어가면 안 된다 — 결과 집합이 달라서
+                # 이미 보여준 행이 다음 페이지로 다시 나온다. FTS에 히트가
+                # 하나라도 있으면 그 엔진의 끝으로 간주하고 여기서 마친다.
+                if offset > 0 and conn.execute(_FTS_ANY_SQL, (match,)).fetchone():
+                    return []
+            except sqlite3.OperationalError:
+                pass
+
     joins = _build_tag_joins(conn)
 
     # 태그 JOIN 가능하면 tag까지 검색
     if joins:
-        sql = f"""
-        SELECT DISTINCT
-            p.print_id,
-            p.card_number,
-            COALESCE(p.name_ja,'') AS name_ja,
-            COALESCE(ko.name,'') AS name_ko
-        FROM prints p
-        LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
-        {joins}
-        WHERE
-            UPPER(p.card_number) LIKE UPPER(?)
-            OR COALESCE(p.name_ja,'') LIKE ?
-            OR COALESCE(ko.name,'') LIKE ?
-            OR COALESCE(ko.effect_text,'') LIKE ?
-            OR (t.tag IS NOT NULL AND (t.tag LIKE ? OR COALESCE(t.normalized,'') LIKE ?))
-        """
-        params = [like, like, like, like, like, like]
-
+        norm_terms = [term for term in normalized_terms if term]
+        has_limit = limit is not None and limit > 0
+        has_offset = has_limit and offset > 0
+
+        key = ("suggest", joins, len(terms), len(norm_terms), has_limit, has_offset)
+        sql = _SQL_CACHE.get(key)
+        if sql is None:
+            sql = f"""
+            SELECT DISTINCT
+                p.print_id,
+                p.card_number,
+                COALESCE(p.name_ja,'') AS name_ja,
+                COALESCE(ko.name,'') AS name_ko,
+                COALESCE(p.image_url,'') AS image_url
+            FROM prints p
+            LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
+            {joins}
+            WHERE
+                UPPER(p.card_number) LIKE UPPER(?)
+                OR COALESCE(p.name_ja,'') LIKE ?
+                OR COALESCE(ko.name,'') LIKE ?
+                OR COALESCE(ko.effect_text,'') LIKE ?
+                OR (t.tag IS NOT NULL AND (t.tag LIKE ? OR COALESCE(t.normalized,'') LIKE ?))
+            """
+            sql += " OR t.tag LIKE ? OR COALESCE(t.normalized,'') LIKE ?" * len(terms)
+            if norm_terms:
+                norm_tag = _sql_normalize_expr("t.tag")
+                norm_normalized = _sql_normalize_expr("t.normalized")
+                sql += f" OR {norm_tag} LIKE ? OR {norm_normalized} LIKE ?" * len(norm_terms)
+            sql += " ORDER BY p.card_number"
+            if has_limit:
+                sql += " LIMIT ?"
+                if has_offset:
+                    sql += " OFFSET ?"
+            _SQL_CACHE[key] = sql
+
+        params: list[object] = [like, like, like, like, like, like]
         for term in terms:
-            sql += " OR t.tag LIKE ? OR COALESCE(t.normalized,'') LIKE ?"
             params += [f"%{term}%", f"%{term}%"]
-
-        if normalized_terms:
-            norm_tag = _sql_normalize_expr("t.tag")
-            norm_normalized = _sql_normalize_expr("t.normalized")
-            for term in normalized_terms:
-                if not term:
-                    continue
-                sql += f" OR {norm_tag} LIKE ? OR {norm_normalized} LIKE ?"
-                params += [f"%{term}%", f"%{term}%"]
-
-        sql += " ORDER BY p.card_number"
-        if limit is not None and limit > 0:
-            sql += " LIMIT ?"
+        for term in norm_terms:
+            params += [f"%{term}%", f"%{term}%"]
+        if has_limit:
             params.append(limit)
+            if has_offset:
+                params.append(offset)
 
-        return [dict(r) for r in conn.execute(sql, params)]
+        return _tuple_rows(conn.execute(sql, params))
 
     # 태그 JOIN 불가하면 카드번호/이름만 검색
     sql = """
@@ -206,7 +304,8 @@ def query_suggest(conn: sqlite3.Connection, q: str, limit: int | None = None) ->
         p.print_id,
         p.card_number,
         COALESCE(p.name_ja,'') AS name_ja,
-        COALESCE(ko.name,'') AS name_ko
+        COALESCE(ko.name,'') AS name_ko,
+        COALESCE(p.image_url,'') AS image_url
     FROM prints p
     LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
     WHERE UPPER(p.card_number) LIKE UPPER(?)
@@ -219,10 +318,13 @@ def query_suggest(conn: sqlite3.Connection, q: str, limit: int | None = None) ->
     if limit is not None and limit > 0:
         sql += " LIMIT ?"
         params.append(limit)
-    return [dict(r) for r in conn.execute(sql, params)]
+        if offset > 0:
+            sql += " OFFSET ?"
+            params.append(offset)
+    return _tuple_rows(conn.execute(sql, params))
 
 
-def query_exact(conn: sqlite3.Connection, q: str, limit: int | None = None) -> list[dict]:
+def query_exact(conn: sqlite3.Connection, q: str, limit: int | None = None, offset: int = 0) -> list[tuple]:
     q = (q or "").strip()
     if not q:
         return []
@@ -233,53 +335,69 @@ def query_exact(conn: sqlite3.Connection, q: str, limit: int | None = None) -> l
     joins = _build_tag_joins(conn)
 
     if joins:
-        sql = f"""
-        SELECT DISTINCT
-            p.print_id,
-            p.card_number,
-            COALESCE(p.name_ja,'') AS name_ja,
-            COALESCE(ko.name,'') AS name_ko
-        FROM prints p
-        LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
-        {joins}
-        WHERE
-            UPPER(COALESCE(p.card_number,'')) = UPPER(?)
-            OR LOWER(COALESCE(p.name_ja,'')) = LOWER(?)
-            OR LOWER(COALESCE(ko.name,'')) = LOWER(?)
-            OR LOWER(COALESCE(ko.effect_text,'')) = LOWER(?)
-            OR (
-                t.tag IS NOT NULL
-                AND (
-                    LOWER(t.tag) = LOWER(?)
-                    OR LOWER(COALESCE(t.normalized,'')) = LOWER(?)
+        has_limit = limit is not None and limit > 0
+        has_offset = has_limit and offset > 0
+
+        key = ("exact", joins, len(terms), bool(normalized_q), has_limit, has_offset)
+        sql = _SQL_CACHE.get(key)
+        if sql is None:
+            sql = f"""
+            SELECT DISTINCT
+                p.print_id,
+                p.card_number,
+                COALESCE(p.name_ja,'') AS name_ja,
+                COALESCE(ko.name,'') AS name_ko,
+                COALESCE(p.image_url,'') AS image_url
+            FROM prints p
+            LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
+            {joins}
+            WHERE
+                UPPER(COALESCE(p.card_number,'')) = UPPER(?)
+                OR LOWER(COALESCE(p.name_ja,'')) = LOWER(?)
+                OR LOWER(COALESCE(ko.name,'')) = LOWER(?)
+                OR LOWER(COALESCE(ko.effect_text,'')) = LOWER(?)
+                OR (
+                    t.tag IS NOT NULL
+                    AND (
+                        LOWER(t.tag) = LOWER(?)
+                        OR LOWER(COALESCE(t.normalized,'')) = LOWER(?)
+                    )
                 )
+            """
+            sql += (
+                " OR LOWER(t.tag) = LOWER(?) OR LOWER(COALESCE(t.normalized,'')) = LOWER(?)"
+                * len(terms)
             )
-        """
-        params: list[object] = [q, q, q, q, q, q]
+            if normalized_q:
+                norm_tag = _sql_normalize_expr("t.tag")
+                norm_normalized = _sql_normalize_expr("t.normalized")
+                sql += f" OR {norm_tag} = ? OR {norm_normalized} = ?"
+            sql += " ORDER BY p.card_number"
+            if has_limit:
+                sql += " LIMIT ?"
+                if has_offset:
+                    sql += " OFFSET ?"
+            _SQL_CACHE[key] = sql
 
+        params: list[object] = [q, q, q, q, q, q]
         for term in terms:
-            sql += " OR LOWER(t.tag) = LOWER(?) OR LOWER(COALESCE(t.normalized,'')) = LOWER(?)"
             params += [term, term]
-
         if normalized_q:
-            norm_tag = _sql_normalize_expr("t.tag")
-            norm_normalized = _sql_normalize_expr("t.normalized")
-            sql += f" OR {norm_tag} = ? OR {norm_normalized} = ?"
             params += [normalized_q, normalized_q]
-
-        sql += " ORDER BY p.card_number"
-        if limit is not None and limit > 0:
-            sql += " LIMIT ?"
+        if has_limit:
             params.append(limit)
+            if has_offset:
+                params.append(offset)
 
-        return [dict(r) for r in conn.execute(sql, params)]
+        return _tuple_rows(conn.execute(sql, params))
 
     sql = """
     SELECT
         p.print_id,
         p.card_number,
         COALESCE(p.name_ja,'') AS name_ja,
-        COALESCE(ko.name,'') AS name_ko
+        COALESCE(ko.name,'') AS name_ko,
+        COALESCE(p.image_url,'') AS image_url
     FROM prints p
     LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
     WHERE
@@ -293,7 +411,10 @@ def query_exact(conn: sqlite3.Connection, q: str, limit: int | None = None) -> l
     if limit is not None and limit > 0:
         sql += " LIMIT ?"
         params.append(limit)
-    return [dict(r) for r in conn.execute(sql, params)]
+        if offset > 0:
+            sql += " OFFSET ?"
+            params.append(offset)
+    return _tuple_rows(conn.execute(sql, params))
 
 def load_card_detail(conn: sqlite3.Connection, pid: int) -> dict | None:
     r = conn.execute(
@@ -326,6 +447,50 @@ def get_print_brief(conn: sqlite3.Connection, print_id: int) -> dict | None:
     ).fetchone()
     return dict(row) if row else None
 
+def _has_card_view(conn: sqlite3.Connection) -> bool:
+    key = _conn_key(conn)
+    cached = _VIEW_CACHE.get(key)
+    if cached is None:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='card_view'"
+        ).fetchone()
+        cached = bool(row)
+        _VIEW_CACHE[key] = cached
+    return cached
+
+
+def get_print_with_detail(conn: sqlite3.Connection, print_id: int) -> dict | None:
+    """선택 경로 전용: brief + 상세 텍스트를 한 번의 쿼리로 가져온다."""
+    # 갱신 파이프라인이 구운 card_view가 있으면 조인 없이 PK 단건 조회
+    if _has_card_view(conn):
+        try:
+            row = conn.execute(
+                "SELECT print_id, card_number, name_ja, name_ko, image_url, ko_text, ko_name"
+                " FROM card_view WHERE print_id=?",
+                (print_id,),
+            ).fetchone()
+            return dict(row) if row else None
+        except sqlite3.OperationalError:
+            pass
+    row = conn.execute(
+        """
+        SELECT
+            p.print_id,
+            p.card_number,
+            COALESCE(p.name_ja,'') AS name_ja,
+            COALESCE(ko.name,'') AS name_ko,
+            COALESCE(p.image_url,'') AS image_url,
+            ko.effect_text AS ko_text,
+            ko.name AS ko_name
+        FROM prints p
+        LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
+        WHERE p.print_id=?
+        """,
+        (print_id,),
+    ).fetchone()
+    return dict(row) if row else None
+
+
 def db_exists(path: str) -> bool:
     p = Path(path)
     return p.exists() and p.is_file() and p.stat().st_size > 0
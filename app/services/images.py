@@ -1,12 +1,21 @@
 # app/services/images.py
 import os
 import re
+import threading
+from email.utils import formatdate
+from functools import lru_cache
+from http.client import HTTPConnection, HTTPSConnection
 from pathlib import Path
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from urllib.parse import urljoin, urlsplit
 
 BASE = "https://hololive-official-cardgame.com"
 SAFE_CARD_NUMBER_RE = re.compile(r"[^A-Za-z0-9._-]+")
+USER_AGENT = "hOCG_H/1.1"
+MAX_REDIRECTS = 3
+
+# keep-alive 재사용: 스레드마다 호스트별 커넥션을 들고 있으면
+# 연속 다운로드(프리페치)에서 TCP/TLS 핸드셰이크가 한 번으로 끝난다.
+_conn_local = threading.local()
 
 def _sanitize_card_number(card_number: str) -> str:
     safe = card_number.strip()
@@ -26,6 +35,8 @@ def local_image_path(data_root: Path, card_number: str) -> Path:
     safe = _sanitize_card_number(card_number)
     return images_dir(data_root) / f"{safe}.png"
 
+# 선택/프리페치 경로에서 같은 URL로 반복 호출되므로 urljoin 비용을 캐시.
+@lru_cache(maxsize=512)
 def resolve_url(image_url: str) -> str:
     if not image_url:
         return ""
@@ -34,26 +45,90 @@ def resolve_url(image_url: str) -> str:
         return image_url
     return urljoin(BASE, image_url)
 
+def _open_conn(scheme: str, netloc: str, timeout: int):
+    cls = HTTPSConnection if scheme == "https" else HTTPConnection
+    return cls(netloc, timeout=timeout)
+
+def _request(u: str, timeout: int, headers: dict[str, str] | None = None):
+    parts = urlsplit(u)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    pool = getattr(_conn_local, "pool", None)
+    if pool is None:
+        pool = {}
+        _conn_local.pool = pool
+
+    req_headers = {"User-Agent": USER_AGENT}
+    if headers:
+        req_headers.update(headers)
+
+    key = (parts.scheme, parts.netloc)
+    conn = pool.get(key)
+    reused = conn is not None
+    if not reused:
+        conn = _open_conn(parts.scheme, parts.netloc, timeout)
+        pool[key] = conn
+    try:
+        conn.request("GET", path, headers=req_headers)
+        return conn.getresponse()
+    except Exception:
+        conn.close()
+        pool.pop(key, None)
+        if not reused:
+            raise
+        # 서버가 keep-alive를 끊었을 수 있으니 새 커넥션으로 한 번만 재시도
+        conn = _open_conn(parts.scheme, parts.netloc, timeout)
+        pool[key] = conn
+        conn.request("GET", path, headers=req_headers)
+        return conn.getresponse()
+
 def download_image(url: str, dest: Path, timeout: int = 30) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     u = resolve_url(url)
     if not u:
         raise ValueError("empty image url")
 
-    tmp = dest.with_suffix(dest.suffix + ".tmp")
+    # 이미 받아둔 파일이 있으면 조건부 GET: 변경이 없으면 304로 본문 없이 끝난다.
+    headers: dict[str, str] | None = None
     try:
-        req = Request(u, headers={"User-Agent": "hOCG_H/1.1"})
-        # 원자적 저장(임시→교체)
-        with urlopen(req, timeout=timeout) as response, open(tmp, "wb") as f:
-            while True:
-                chunk = response.read(1024 * 256)
-                if not chunk:
-                    break
-                f.write(chunk)
-        os.replace(tmp, dest)
-    finally:
-        if tmp.exists():
-            try:
-                tmp.unlink()
-            except Exception:
-                pass
+        headers = {"If-Modified-Since": formatdate(dest.stat().st_mtime, usegmt=True)}
+    except OSError:
+        pass
+
+    for _ in range(MAX_REDIRECTS + 1):
+        response = _request(u, timeout, headers)
+        if response.status == 304:
+            response.read()
+            return
+        if response.status in (301, 302, 303, 307, 308):
+            location = response.getheader("Location")
+            response.read()  # 끝까지 읽어야 커넥션이 재사용된다
+            if not location:
+                raise OSError(f"redirect without Location: {u}")
+            u = urljoin(u, location)
+            continue
+        if response.status != 200:
+            response.read()
+            raise OSError(f"HTTP {response.status} for {u}")
+
+        tmp = dest.with_suffix(dest.suffix + ".tmp")
+        try:
+            # 원자적 저장(임시→교체)
+            with open(tmp, "wb") as f:
+                while True:
+                    chunk = response.read(1024 * 256)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                try:
+                    tmp.unlink()
+                except Exception:
+                    pass
+        return
+
+    raise OSError(f"too many redirects: {url}")
@@ -1,4 +1,5 @@
 # app/services/pipeline.py
+import asyncio
 import os
 import re
 import shutil
@@ -6,6 +7,7 @@ import sqlite3
 import subprocess
 import sys
 import json
+import time
 from pathlib import Path
 from typing import Iterator
 from urllib.request import Request, urlopen
@@ -105,6 +107,135 @@ def _write_release_meta(db_path: Path, release_info: dict) -> None:
     finally:
         conn.close()
 
+def _mark_db_ready(db_path: str) -> None:
+    """갱신 성공 표시로 user_version에 epoch를 기록.
+
+    UI 헬스 체크가 테이블을 뒤지지 않고 헤더 페이지의 pragma 한 번으로
+    끝나게 해준다. 실패해도 기존 테이블 프로브가 fallback이라 조용히 넘어간다.
+    """
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute(f"PRAGMA user_version = {int(time.time())}")
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception:
+        pass
+
+
+def _build_search_index(db_path: str) -> None:
+    """검색용 FTS5 trigram 인덱스(card_search)를 재구축한다.
+
+    LIKE '%q%'는 전체 스캔이라 카드 수에 비례해 느려진다. 갱신 시점에
+    한 번 인덱스를 구워 두면 검색은 MATCH로 즉답한다. FTS5/trigram을
+    지원하지 않는 sqlite 빌드에서는 조용히 생략하고 LIKE 경로가 그대로
+    동작한다.
+    """
+    try:
+        conn = sqlite3.connect(db_path)
+    except Exception:
+        return
+    try:
+        conn.execute("DROP TABLE IF EXISTS card_search")
+        conn.execute(
+            "CREATE VIRTUAL TABLE card_search USING fts5("
+            "card_number, name_ja, name_ko, effect_ko, tags, "
+            "print_id UNINDEXED, image_url UNINDEXED, tokenize='trigram')"
+        )
+        base = """
+            SELECT
+                p.print_id,
+                p.card_number,
+                COALESCE(p.name_ja,''),
+                COALESCE(ko.name,''),
+                COALESCE(ko.effect_text,''),
+                COALESCE(p.image_url,''),
+                {tags_expr}
+            FROM prints p
+            LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
+        """
+        # 스키마가 DB마다 달라 태그 집계는 되는 형태를 순서대로 시도
+        tag_exprs = (
+            "(SELECT GROUP_CONCAT(t.tag || ' ' || COALESCE(t.normalized,''), ' ')"
+            " FROM print_tags pt JOIN tags t ON t.tag = pt.tag"
+            " WHERE pt.print_id = p.print_id)",
+            "(SELECT GROUP_CONCAT(t.tag || ' ' || COALESCE(t.normalized,''), ' ')"
+            " FROM print_tags pt JOIN tags t ON t.tag_id = pt.tag_id"
+            " WHERE pt.print_id = p.print_id)",
+            "''",
+        )
+        rows = None
+        for tags_expr in tag_exprs:
+            try:
+                rows = conn.execute(base.format(tags_expr=tags_expr)).fetchall()
+                break
+            except sqlite3.OperationalError:
+                continue
+        if rows is None:
+            conn.execute("DROP TABLE IF EXISTS card_search")
+            conn.commit()
+            return
+        conn.executemany(
+            "INSERT INTO card_search"
+            "(print_id, card_number, name_ja, name_ko, effect_ko, image_url, tags) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(r[0], r[1], r[2], r[3], r[4], r[5], r[6] or "") for r in rows],
+        )
+        conn.commit()
+    except sqlite3.OperationalError:
+        try:
+            conn.execute("DROP TABLE IF EXISTS card_search")
+            conn.commit()
+        except Exception:
+            pass
+    except Exception:
+        pass
+    finally:
+        conn.close()
+
+
+def _build_card_view(db_path: str) -> None:
+    """클릭 핫패스용 비정규화 테이블(card_view)을 재구축한다.
+
+    목록/상세가 읽는 모든 필드를 한 행에 모아 두면 선택할 때마다
+    prints↔card_texts_ko 조인을 도는 대신 PK 단건 조회로 끝난다.
+    """
+    try:
+        conn = sqlite3.connect(db_path)
+    except Exception:
+        return
+    try:
+        conn.execute("DROP TABLE IF EXISTS card_view")
+        conn.execute(
+            """
+            CREATE TABLE card_view AS
+            SELECT
+                p.print_id,
+                p.card_number,
+                COALESCE(p.name_ja,'') AS name_ja,
+                COALESCE(ko.name,'') AS name_ko,
+                COALESCE(p.image_url,'') AS image_url,
+                ko.effect_text AS ko_text,
+                ko.name AS ko_name
+            FROM prints p
+            LEFT JOIN card_texts_ko ko ON ko.print_id = p.print_id
+            """
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_card_view_pid ON card_view(print_id)"
+        )
+        conn.commit()
+    except Exception:
+        try:
+            conn.execute("DROP TABLE IF EXISTS card_view")
+            conn.commit()
+        except Exception:
+            pass
+    finally:
+        conn.close()
+
+
 def _py() -> str:
     return sys.executable
 
@@ -140,6 +271,32 @@ def _run_tool(
         raise RuntimeError(f"{label} failed rc={rc}")
 
 
+async def _run_tool_async(
+    cmd: list[str],
+    root: Path,
+    env: dict[str, str],
+    label: str,
+):
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=str(root),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=env,
+    )
+    if process.stdout is None:
+        raise RuntimeError("process stdout not available")
+    while True:
+        raw = await process.stdout.readline()
+        if not raw:
+            break
+        line = raw.decode("utf-8", errors="replace").rstrip("\n")
+        yield _mask_card_numbers(line)
+    rc = await process.wait()
+    if rc != 0:
+        raise RuntimeError(f"{label} failed rc={rc}")
+
+
 def _pick_release_db_asset(release: dict) -> tuple[str, str]:
     assets = release.get("assets") or []
     if not assets:
@@ -306,6 +463,9 @@ def run_update_and_refine(
     try:
         yield "[INFO] GitHub Releases에서 최신 DB 확인 중..."
         tag, asset_name = _download_latest_release_db(db_path)
+        _mark_db_ready(db_path)
+        _build_search_index(db_path)
+        _build_card_view(db_path)
         yield f"[INFO] 다운로드 완료: {asset_name} (release: {tag})"
         yield "[DONE] DB 갱신 완료"
         return
@@ -320,6 +480,9 @@ def run_update_and_refine(
             return
         restored = _restore_db_from_bundle(db_path)
         if restored is not None:
+            _mark_db_ready(db_path)
+            _build_search_index(db_path)
+            _build_card_view(db_path)
             yield f"[INFO] 모바일 번들 DB 복원: {restored}"
             yield "[DONE] DB 복원 완료"
             return
@@ -366,3 +529,102 @@ def run_update_and_refine(
         if ko_overwrite:
             cmd3.append("--overwrite")
         yield from _run_tool(cmd3, root, env, "namuwiki import")
+
+    _mark_db_ready(db_path)
+    _build_search_index(db_path)
+    _build_card_view(db_path)
+
+
+async def run_update_and_refine_async(
+    db_path: str,
+    delay: float = 0.1,
+    workers: int = 8,
+    *,
+    ko_page: str | None = None,
+    ko_page_file: str | None = None,
+    ko_overwrite: bool = False,
+    ko_sheet_url: str | None = None,
+    ko_sheet_gid: str | None = None,
+):
+    """run_update_and_refine의 asyncio 버전.
+
+    워커 스레드로 제너레이터 전체를 감싸는 대신, 다운로드는 to_thread로,
+    도구 서브프로세스는 create_subprocess_exec로 돌려 이벤트 루프에서
+    라인 단위로 스트리밍한다. UI가 같은 루프에서 로그를 바로 붙일 수 있다.
+    """
+    try:
+        yield "[INFO] GitHub Releases에서 최신 DB 확인 중..."
+        tag, asset_name = await asyncio.to_thread(_download_latest_release_db, db_path)
+        await asyncio.to_thread(_mark_db_ready, db_path)
+        await asyncio.to_thread(_build_search_index, db_path)
+        await asyncio.to_thread(_build_card_view, db_path)
+        yield f"[INFO] 다운로드 완료: {asset_name} (release: {tag})"
+        yield "[DONE] DB 갱신 완료"
+        return
+    except Exception as ex:
+        yield f"[WARN] 릴리즈 DB 다운로드 실패: {ex}"
+
+    located = _find_project_root_with_tools()
+    if located is None:
+        existing_db = Path(db_path)
+        if existing_db.exists() and existing_db.is_file() and existing_db.stat().st_size > 0:
+            yield "[INFO] DB 갱신 도구가 번들에 없어 기존 DB를 유지합니다."
+            return
+        restored = await asyncio.to_thread(_restore_db_from_bundle, db_path)
+        if restored is not None:
+            await asyncio.to_thread(_mark_db_ready, db_path)
+            await asyncio.to_thread(_build_search_index, db_path)
+            await asyncio.to_thread(_build_card_view, db_path)
+            yield f"[INFO] 모바일 번들 DB 복원: {restored}"
+            yield "[DONE] DB 복원 완료"
+            return
+        expected_root = Path(__file__).resolve().parents[2]
+        raise FileNotFoundError(
+            f"missing: {expected_root / 'tools' / 'hocg_tool2.py'}; no bundled DB found"
+        )
+
+    root, tool_scrape, tool_refine, tool_ko = located
+
+    env = dict(**os.environ, PYTHONUTF8="1", PYTHONIOENCODING="utf-8")
+
+    # 1) scrape
+    cmd1 = [
+        _py(),
+        str(tool_scrape),
+        "--db",
+        db_path,
+        "scrape",
+        "--delay",
+        str(delay),
+        "--workers",
+        str(workers),
+    ]
+    async for line in _run_tool_async(cmd1, root, env, "scrape"):
+        yield line
+
+    # 2) refine
+    cmd2 = [_py(), str(tool_refine), "--db", db_path]
+    async for line in _run_tool_async(cmd2, root, env, "refine"):
+        yield line
+
+    sheet_url = ko_sheet_url or os.environ.get("HOCG_KO_SHEET_URL")
+    sheet_gid = ko_sheet_gid or os.environ.get("HOCG_KO_SHEET_GID")
+
+    if ko_page or ko_page_file or sheet_url:
+        cmd3 = [_py(), str(tool_ko), "--db", db_path]
+        if ko_page:
+            cmd3.extend(["--page", ko_page])
+        if ko_page_file:
+            cmd3.extend(["--page-file", ko_page_file])
+        if sheet_url:
+            cmd3.extend(["--sheet-url", sheet_url])
+        if sheet_gid:
+            cmd3.extend(["--sheet-gid", sheet_gid])
+        if ko_overwrite:
+            cmd3.append("--overwrite")
+        async for line in _run_tool_async(cmd3, root, env, "namuwiki import"):
+            yield line
+
+    await asyncio.to_thread(_mark_db_ready, db_path)
+    await asyncio.to_thread(_build_search_index, db_path)
+    await asyncio.to_thread(_build_card_view, db_path)
@@ -2,25 +2,26 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import re
 import sqlite3
 import threading
 import sys
-import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
 import flet as ft
 
 from app.services.db import (
+    apply_perf_pragmas,
     open_db,
     query_suggest,
     query_exact,
-    load_card_detail,
-    get_print_brief,
+    get_print_with_detail,
     db_exists,
     clear_conn_cache,
 )
-from app.services.pipeline import run_update_and_refine, get_latest_release_db_info
 from app.paths import get_default_data_root, get_project_root
 from app.services.images import local_image_path, download_image, resolve_url
 from app.services.verify import run_startup_checks
@@ -40,6 +41,15 @@ SECTION_LABELS = (
     "LIFE",
     "HP",
 )
+# 상세 렌더 핫패스용: 라벨은 전부 공백 없는 한 토큰이라 첫 토큰만 떼서
+# 집합 조회 한 번이면 된다. 라벨 수만큼 startswith를 도는 것보다 싸다.
+SECTION_LABEL_SET = frozenset(SECTION_LABELS)
+
+_UA_HINT_RE = re.compile(r"(android|mobile|tablet)")
+
+# SQL 리터럴을 모듈 상수로 고정해 sqlite3 statement 캐시 키가 안정되게 한다.
+SQL_PRINTS_TABLE_EXISTS = "SELECT 1 FROM sqlite_master WHERE type='table' AND name='prints'"
+SQL_PRINTS_ANY = "SELECT EXISTS(SELECT 1 FROM prints LIMIT 1)"
 
 DB_MISSING_TOAST = "DB파일이 존재하지 않습니다. 메뉴에서 DB 수동갱신을 실행해주세요"
 DB_UPDATING_TOAST = "갱신중..."
@@ -47,6 +57,8 @@ DB_UPDATED_TOAST = "갱신완료"
 APP_NAME = "hOCG_H"
 SEARCH_MODE_PARTIAL = "partial"
 SEARCH_MODE_EXACT = "exact"
+# 타이핑 버스트 중 마지막 입력만 쿼리로 이어지게 하는 대기 시간.
+SEARCH_DEBOUNCE_S = 0.15
 
 def with_opacity(opacity: float, color: str) -> str:
     return COLORS.with_opacity(opacity, color)
@@ -70,6 +82,21 @@ def _image_fit_contain():
 IMAGE_FIT_CONTAIN = _image_fit_contain()
 MENU_ICON = ICONS.MENU if hasattr(ICONS, "MENU") else ICONS.MORE_VERT
 
+# 레이아웃 리빌드 때마다 재할당하지 않도록 공용 스타일 객체는 한 번만 생성.
+BORDER_FAINT = ft.border.all(1, with_opacity(0.15, COLORS.WHITE))
+BG_CHIP = with_opacity(0.18, COLORS.BLUE_GREY_700)
+PAD_ROOT = ft.padding.only(left=10, right=10, top=6, bottom=10)
+PAD_PANEL_LABEL = ft.padding.only(left=10, top=4)
+
+def build_panel(body: ft.Control, height: int | None = None, padding: int | None = 10) -> ft.Container:
+    return ft.Container(
+        content=body,
+        height=height,
+        padding=padding,
+        border=BORDER_FAINT,
+        border_radius=10,
+    )
+
 def icon_dir(project_root: Path) -> Path:
     return project_root / "app"
 
@@ -84,10 +111,10 @@ def launch_app(db_path: str) -> None:
     data_root = get_default_data_root(APP_NAME)
 
     def main(page: ft.Page) -> None:
-        thread_local = threading.local()
         conn_epoch = {"value": 0}
-        db_health_cache = {"path": None, "value": None, "checked_at": 0.0}
-        DB_HEALTH_CACHE_TTL = 2.0
+        # key = (path, mtime_ns, size, epoch): DB 내용이 실제로 바뀔 때만 바뀐다.
+        # 파일이 그대로면 sqlite를 열지 않고 stat 한 번으로 판정을 재사용.
+        db_health_cache = {"path": None, "key": None, "value": None, "exists": None}
 
         page.title = APP_NAME
         page.padding = 0
@@ -141,12 +168,13 @@ def launch_app(db_path: str) -> None:
         update_status = ft.Text("", size=12, color=COLORS.RED_300, visible=False)
 
         # --- Results / Detail ---
-        lv = ft.Column(spacing=2, scroll=ft.ScrollMode.AUTO, expand=True)
+        # ListView는 보이는 범위만 그리고, item_extent 고정으로 레이아웃 계산도 생략된다.
+        lv = ft.ListView(spacing=2, expand=True, item_extent=48)
         detail_lv = ft.Column(spacing=4, scroll=ft.ScrollMode.AUTO, expand=True)
         detail_texts = {"ko": ""}
 
         # --- Image area ---
-        def build_image_placeholder(text: str, loading: bool = False) -> ft.Control:
+        def _new_image_placeholder(text: str, loading: bool = False) -> ft.Control:
             marker: ft.Control
             if loading:
                 marker = ft.ProgressRing(width=24, height=24, stroke_width=2)
@@ -161,42 +189,52 @@ def launch_app(db_path: str) -> None:
                 ),
                 alignment=ALIGN_CENTER,
                 expand=True,
-                border=ft.border.all(1, with_opacity(0.15, COLORS.WHITE)),
+                border=BORDER_FAINT,
             )
 
-        def build_image_widget(
-            image_path: Path | None,
-            image_url: str | None = None,
-            *,
-            loading: bool = False,
-            placeholder_text: str = "이미지 없음",
-        ) -> ft.Control:
-            if loading:
-                return build_image_placeholder("이미지 로딩 중...", loading=True)
+        # 같은 문구의 플레이스홀더는 인스턴스를 재사용한다.
+        # 이미지 없는 카드 사이를 빠르게 오갈 때 위젯 재생성이 사라진다.
+        _placeholder_cache: dict[tuple[str, bool], ft.Control] = {}
 
-            error_content = build_image_placeholder("이미지 로딩 실패")
-            if image_path and image_path.exists():
-                return ft.Image(
-                    src=str(image_path),
-                    fit=IMAGE_FIT_CONTAIN,
-                    expand=True,
-                    error_content=error_content,
-                )
-            if image_url:
-                return ft.Image(
-                    src=image_url,
-                    fit=IMAGE_FIT_CONTAIN,
-                    expand=True,
-                    error_content=error_content,
-                )
-            return build_image_placeholder(placeholder_text)
+        def build_image_placeholder(text: str, loading: bool = False) -> ft.Control:
+            key = (text, loading)
+            widget = _placeholder_cache.get(key)
+            if widget is None:
+                widget = _new_image_placeholder(text, loading)
+                _placeholder_cache[key] = widget
+            return widget
+
+        # 카드 전환마다 ft.Image를 새로 만들지 않고 하나를 두고 src만 바꾼다.
+        # 네이티브 위젯 재생성이 사라지고 엔진의 이미지 캐시도 src 기준으로 적중한다.
+        _img_widget = ft.Image(
+            src="",
+            fit=IMAGE_FIT_CONTAIN,
+            expand=True,
+            visible=False,
+            error_content=_new_image_placeholder("이미지 로딩 실패"),
+        )
+        _placeholder_slot = ft.Container(
+            content=build_image_placeholder("이미지 없음"),
+            alignment=ALIGN_CENTER,
+            expand=True,
+        )
+
+        def _show_image(src: str) -> None:
+            _img_widget.src = src
+            _img_widget.visible = True
+            _placeholder_slot.visible = False
+
+        def _show_placeholder(text: str, loading: bool = False) -> None:
+            _placeholder_slot.content = build_image_placeholder(text, loading)
+            _placeholder_slot.visible = True
+            _img_widget.visible = False
 
         img_container = ft.Container(
-            content=build_image_widget(None),
+            content=ft.Stack([_placeholder_slot, _img_widget], expand=True),
             expand=True,
             padding=10,
             bgcolor=None,
-            border=ft.border.all(1, with_opacity(0.15, COLORS.WHITE)),
+            border=BORDER_FAINT,
         )
 
         selected_print_id = {"id": None}
@@ -205,13 +243,18 @@ def launch_app(db_path: str) -> None:
         results_state = {"rows": []}
         image_panel_state = {"collapsed": False}
         search_mode_state = {"value": SEARCH_MODE_PARTIAL}
-        update_state = {"running": False}
+        update_state = {"running": False, "menu_open": False}
         update_prompt_state = {"shown": False}
         downloading = set()
         download_lock = threading.Lock()
 
+        # 갱신 파이프라인은 초당 수십 줄을 뿜는다. 줄마다 flush하면 쓰기
+        # 시스템콜이 줄 수만큼 나가므로 버퍼링에 맡기고, 상태가 바뀌는
+        # 경계 라인에서만 강제로 비운다.
+        _LOG_FLUSH_PREFIXES = ("[START]", "[DONE]", "[ERROR]", "[WARN]")
+
         def append_log(s: str) -> None:
-            print(s, flush=True)
+            print(s, flush=s.startswith(_LOG_FLUSH_PREFIXES))
 
         toast_text = ft.Text(
             "",
@@ -245,51 +288,118 @@ def launch_app(db_path: str) -> None:
 
         toast_state = {"seq": 0, "message": None}
 
+        # 헬퍼들이 각자 page.update()를 부르면 한 동작에 전체 트리 diff가 여러 번 돈다.
+        # 이벤트 루프 틱당 한 번만 flush하도록 더티 플래그로 모아서 처리.
+        ui_dirty = asyncio.Event()
+
+        async def _ui_flusher() -> None:
+            while True:
+                await ui_dirty.wait()
+                ui_dirty.clear()
+                page.update()
+
+        def request_update() -> None:
+            ui_dirty.set()
+
+        # 한 동작(선택/검색)이 page.update()를 여러 번 직접 부르는 구간은
+        # 배치로 묶어 마지막에 한 번만 flush한다.
+        update_batch = {"depth": 0}
+
+        @contextmanager
+        def batch_updates():
+            update_batch["depth"] += 1
+            try:
+                yield
+            finally:
+                update_batch["depth"] -= 1
+                if update_batch["depth"] == 0:
+                    page.update()
+
+        # 헬스 체크가 2초마다 sqlite3.connect를 새로 여는 비용을 없애기 위해
+        # 프로브 전용 커넥션을 경로가 바뀔 때까지 재사용한다(페이지 캐시도 유지됨).
+        db_probe = {"conn": None, "path": None}
+
+        def close_probe_conn() -> None:
+            conn = db_probe["conn"]
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            db_probe["conn"] = None
+            db_probe["path"] = None
+
+        def get_probe_conn(path: str) -> sqlite3.Connection:
+            if db_probe["conn"] is None or db_probe["path"] != path:
+                close_probe_conn()
+                conn = sqlite3.connect(path, cached_statements=256, check_same_thread=False)
+                apply_perf_pragmas(conn)
+                db_probe["conn"] = conn
+                db_probe["path"] = path
+            return db_probe["conn"]
+
         def invalidate_db_health_cache() -> None:
+            close_probe_conn()
             db_health_cache["path"] = None
+            db_health_cache["key"] = None
             db_health_cache["value"] = None
-            db_health_cache["checked_at"] = 0.0
+            db_health_cache["exists"] = None
+
+        def db_exists_cached(path: str) -> bool:
+            # needs_db_update()가 같은 stat을 이미 수행하므로 같은 경로면 재사용.
+            if db_health_cache["path"] == path and db_health_cache["exists"] is not None:
+                return bool(db_health_cache["exists"])
+            exists = db_exists(path)
+            if db_health_cache["path"] != path:
+                db_health_cache.update({"path": path, "key": None, "value": None})
+            db_health_cache["exists"] = exists
+            return exists
 
         def needs_db_update() -> bool:
             path = (tf_db.value or "").strip()
-            now = time.monotonic()
-            if (
-                db_health_cache["path"] == path
-                and db_health_cache["value"] is not None
-                and now - db_health_cache["checked_at"] < DB_HEALTH_CACHE_TTL
-            ):
-                return bool(db_health_cache["value"])
             if not path:
-                db_health_cache.update({"path": path, "value": True, "checked_at": now})
+                db_health_cache.update(
+                    {"path": path, "key": None, "value": True, "exists": False}
+                )
                 return True
             try:
-                p = Path(path)
-                if not p.exists() or not p.is_file() or p.stat().st_size == 0:
-                    db_health_cache.update({"path": path, "value": True, "checked_at": now})
-                    return True
-            except Exception:
-                db_health_cache.update({"path": path, "value": True, "checked_at": now})
+                st = os.stat(path)
+            except OSError:
+                db_health_cache.update(
+                    {"path": path, "key": None, "value": True, "exists": False}
+                )
+                return True
+            key = (path, st.st_mtime_ns, st.st_size, conn_epoch["value"])
+            if db_health_cache["key"] == key and db_health_cache["value"] is not None:
+                return bool(db_health_cache["value"])
+            if st.st_size == 0 or not os.path.isfile(path):
+                db_health_cache.update(
+                    {"path": path, "key": key, "value": True, "exists": False}
+                )
                 return True
+            db_health_cache["path"] = path
+            db_health_cache["exists"] = True
             try:
-                conn = sqlite3.connect(path)
-                try:
-                    row = conn.execute(
-                        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='prints'"
-                    ).fetchone()
+                conn = get_probe_conn(path)
+                # 갱신 파이프라인이 성공 시 user_version에 epoch를 찍는다.
+                # 헤더 페이지만 읽는 pragma 하나로 판정이 끝나는 fast-path.
+                version = conn.execute("PRAGMA user_version").fetchone()
+                if version and version[0]:
+                    value = False
+                else:
+                    # 파이프라인을 거치지 않은(예: 수동 복사) DB는 테이블 프로브로 fallback.
+                    row = conn.execute(SQL_PRINTS_TABLE_EXISTS).fetchone()
                     if not row:
-                        db_health_cache.update({"path": path, "value": True, "checked_at": now})
-                        return True
-                    count = conn.execute("SELECT COUNT(1) FROM prints").fetchone()
-                    value = (count[0] if count else 0) == 0
-                    db_health_cache.update(
-                        {"path": path, "value": value, "checked_at": now}
-                    )
-                    return value
-                finally:
-                    conn.close()
+                        value = True
+                    else:
+                        # COUNT(1) 전체 스캔 대신 첫 행 존재만 확인(상수 시간).
+                        has_rows = conn.execute(SQL_PRINTS_ANY).fetchone()
+                        value = not (has_rows and has_rows[0])
             except Exception:
-                db_health_cache.update({"path": path, "value": True, "checked_at": now})
-                return True
+                close_probe_conn()
+                value = True
+            db_health_cache.update({"key": key, "value": value})
+            return value
 
         def show_toast(
             message: str,
@@ -311,8 +421,9 @@ def launch_app(db_path: str) -> None:
             toast_text.value = message
             toast_host.visible = True
             if toast_host.page is None:
+                # 아직 overlay 마운트 전에만 전체 트리 update가 필요하다.
                 page.update()
-            if toast_host.page is not None:
+            else:
                 toast_host.update()
 
             if duration_ms is not None and duration_ms > 0:
@@ -329,8 +440,13 @@ def launch_app(db_path: str) -> None:
                         return
                     toast_host.visible = False
                     if should_restore_missing and needs_db_update():
+                        # show_toast가 알아서 토스트 subtree를 update한다.
                         show_toast(DB_MISSING_TOAST, persist=True)
-                    page.update()
+                        return
+                    if toast_host.page is not None:
+                        toast_host.update()
+                    else:
+                        request_update()
 
                 page.run_task(
                     _after_hide,
@@ -407,6 +523,20 @@ def launch_app(db_path: str) -> None:
         def setup_window_icon() -> None:
             ico_path, png_path = icon_paths(project_root)
 
+            # 시작 경로의 exists/stat 콜 4번을 scandir 한 번으로 줄인다.
+            # (DirEntry.stat은 디렉터리 스캔에서 얻은 값을 재사용한다)
+            icon_mtimes: dict[str, float] = {}
+            try:
+                with os.scandir(ico_path.parent) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            icon_mtimes[entry.name] = entry.stat().st_mtime
+            except OSError:
+                pass
+
+            ico_mtime = icon_mtimes.get(ico_path.name)
+            png_mtime = icon_mtimes.get(png_path.name)
+
             def set_icon(path: Path) -> bool:
                 try:
                     page.window.icon = str(path)
@@ -415,14 +545,19 @@ def launch_app(db_path: str) -> None:
                     append_log(f"[WARN] 앱 아이콘 설정 실패: {ex}")
                     return False
 
+            def ico_is_fresh() -> bool:
+                if ico_mtime is None:
+                    return False
+                if png_mtime is None:
+                    return True
+                return ico_mtime >= png_mtime
+
             def ensure_ico_from_png() -> bool:
-                if not png_path.exists():
+                # PIL 변환은 큰 PNG에서 수백 ms 걸릴 수 있다 — 워커 스레드에서만 부른다.
+                if png_mtime is None:
                     return False
-                try:
-                    if ico_path.exists() and ico_path.stat().st_mtime >= png_path.stat().st_mtime:
-                        return True
-                except Exception:
-                    pass
+                if ico_is_fresh():
+                    return True
                 try:
                     from PIL import Image
                 except Exception as ex:
@@ -433,31 +568,38 @@ def launch_app(db_path: str) -> None:
                     img = Image.open(png_path)
                     if img.mode not in ("RGBA", "RGB"):
                         img = img.convert("RGBA")
-                    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+                    # Windows가 가장 가까운 크기를 골라 쓰므로 중간 크기는 인코딩 비용만 든다.
+                    sizes = [(256, 256), (48, 48), (16, 16)]
                     img.save(ico_path, format="ICO", sizes=sizes)
                     return True
                 except Exception as ex:
                     append_log(f"[WARN] 앱 아이콘 변환 실패: {ex}")
                     return False
 
+            async def convert_and_set_ico() -> None:
+                if await asyncio.to_thread(ensure_ico_from_png):
+                    set_icon(ico_path)
+
             is_windows = sys.platform.startswith("win")
 
             # Windows: prefer ICO; PNG can be ignored by the OS without error.
             if is_windows:
-                if ico_path.exists() or ensure_ico_from_png():
-                    if set_icon(ico_path):
-                        return
-                if png_path.exists():
+                if ico_mtime is not None and set_icon(ico_path):
+                    # 오래된 ICO라면 일단 띄워두고 백그라운드에서 새로 굽는다.
+                    if not ico_is_fresh():
+                        page.run_task(convert_and_set_ico)
+                    return
+                if png_mtime is not None:
                     set_icon(png_path)
+                page.run_task(convert_and_set_ico)
                 return
 
             # Non-Windows: PNG first, ICO fallback.
-            if png_path.exists() and set_icon(png_path):
+            if png_mtime is not None and set_icon(png_path):
                 return
-            if ico_path.exists() and set_icon(ico_path):
+            if ico_mtime is not None and set_icon(ico_path):
                 return
-            if ensure_ico_from_png():
-                set_icon(ico_path)
+            page.run_task(convert_and_set_ico)
 
         setup_window_icon()
 
@@ -466,39 +608,97 @@ def launch_app(db_path: str) -> None:
             for issue in issues:
                 append_log(f"[WARN] {issue}")
 
-        def get_conn() -> sqlite3.Connection:
+        # asyncio.to_thread는 호출마다 다른 워커 스레드에 실릴 수 있어서
+        # threading.local 방식은 워커 수만큼 커넥션을 새로 연다.
+        # 작은 공용 풀에서 빌려 쓰고 돌려주면 2~4개의 핫 커넥션만 돈다.
+        CONN_POOL_MAX = 4
+        _conn_pool: list[sqlite3.Connection] = []
+        _conn_pool_meta = {"epoch": -1, "path": None}
+        _conn_pool_lock = threading.Lock()
+
+        def _close_quiet(conn: sqlite3.Connection) -> None:
+            try:
+                clear_conn_cache(conn)
+                conn.close()
+            except Exception:
+                pass
+
+        def _drain_pool_locked() -> None:
+            while _conn_pool:
+                _close_quiet(_conn_pool.pop())
+
+        @contextmanager
+        def pooled_conn():
             path = tf_db.value
             if not path or not path.strip():
                 raise ValueError("DB 경로가 비어있습니다.")
-            conn = getattr(thread_local, "conn", None)
-            if (
-                conn is None
-                or getattr(thread_local, "epoch", -1) != conn_epoch["value"]
-                or getattr(thread_local, "path", None) != path
-            ):
-                try:
-                    if conn is not None:
-                        clear_conn_cache(conn)
-                        conn.close()
-                except Exception:
-                    pass
+            epoch = conn_epoch["value"]
+            conn = None
+            with _conn_pool_lock:
+                if _conn_pool_meta["epoch"] != epoch or _conn_pool_meta["path"] != path:
+                    _drain_pool_locked()
+                    _conn_pool_meta.update({"epoch": epoch, "path": path})
+                elif _conn_pool:
+                    conn = _conn_pool.pop()
+            if conn is None:
                 conn = open_db(path)
-                thread_local.conn = conn
-                thread_local.epoch = conn_epoch["value"]
-                thread_local.path = path
-            return conn
+            try:
+                yield conn
+            finally:
+                with _conn_pool_lock:
+                    if (
+                        _conn_pool_meta["epoch"] == conn_epoch["value"]
+                        and _conn_pool_meta["path"] == path
+                        and len(_conn_pool) < CONN_POOL_MAX
+                    ):
+                        _conn_pool.append(conn)
+                        conn = None
+                if conn is not None:
+                    _close_quiet(conn)
+
+        def drain_conn_pool() -> None:
+            with _conn_pool_lock:
+                _drain_pool_locked()
+
+        # 이미지 존재 확인이 키 입력마다 stat 시스템콜을 날리지 않도록
+        # 시작할 때 이미지 폴더를 한 번 훑어 파일명 집합을 만들어 둔다.
+        image_index: set[str] = set()
+        image_index_state = {"ready": False}
+
+        def _scan_image_names() -> set[str]:
+            names: set[str] = set()
+            try:
+                with os.scandir(data_root / "images") as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.name.endswith(".png"):
+                            names.add(entry.name[:-4])
+            except OSError:
+                pass
+            return names
 
-        def close_thread_conn() -> None:
-            conn = getattr(thread_local, "conn", None)
-            if conn is not None:
-                try:
-                    clear_conn_cache(conn)
-                    conn.close()
-                except Exception:
-                    pass
-            thread_local.conn = None
-            thread_local.epoch = -1
-            thread_local.path = None
+        async def _build_image_index() -> None:
+            image_index.update(await asyncio.to_thread(_scan_image_names))
+            image_index_state["ready"] = True
+
+        def image_on_disk(path: Path) -> bool:
+            if image_index_state["ready"]:
+                return path.stem in image_index
+            return path.exists()
+
+        # local_image_path는 호출마다 파일명 정규화에 images 폴더 mkdir까지 한다.
+        # 카드번호별 경로는 세션 내 불변이라 한 번 계산해 두고 재사용.
+        image_path_cache: dict[str, Path] = {}
+
+        def card_image_path(card_number: str) -> Path:
+            path = image_path_cache.get(card_number)
+            if path is None:
+                path = local_image_path(data_root, card_number)
+                image_path_cache[card_number] = path
+            return path
+
+        # 같은 카드를 다시 보여줄 때 ft.Image를 새로 만들면 이미지를 다시 디코드한다.
+        # 표시 중인 내용의 키를 기억했다가 동일하면 리빌드를 건너뛴다.
+        _img_state = {"key": None}
 
         def set_image_for_card(
             card_number: str,
@@ -507,28 +707,45 @@ def launch_app(db_path: str) -> None:
             loading: bool = False,
             placeholder_text: str = "이미지 없음",
         ) -> None:
-            image_path = local_image_path(data_root, card_number) if card_number else None
+            image_path = card_image_path(card_number) if card_number else None
             resolved = resolve_url((image_url or "").strip())
-            img_container.content = build_image_widget(
-                image_path if image_path and image_path.exists() else None,
+            has_file = bool(image_path and image_on_disk(image_path))
+            key = (
+                str(image_path) if has_file else None,
                 resolved,
-                loading=loading and not (image_path and image_path.exists()),
-                placeholder_text=placeholder_text,
+                loading and not has_file,
+                placeholder_text,
             )
-            page.update()
+            if key == _img_state["key"]:
+                return
+            _img_state["key"] = key
+            if loading and not has_file:
+                _show_placeholder("이미지 로딩 중...", loading=True)
+            elif has_file:
+                _show_image(str(image_path))
+            elif resolved:
+                _show_image(resolved)
+            else:
+                _show_placeholder(placeholder_text)
+            request_update()
 
         def clear_image(placeholder_text: str = "이미지 없음") -> None:
-            img_container.content = build_image_widget(None, placeholder_text=placeholder_text)
-            page.update()
+            key = (None, "", False, placeholder_text)
+            if key == _img_state["key"]:
+                return
+            _img_state["key"] = key
+            _show_placeholder(placeholder_text)
+            request_update()
 
         async def download_selected_image(
             card_number: str,
             image_url: str,
         ) -> None:
-            dest = local_image_path(data_root, card_number)
+            dest = card_image_path(card_number)
             try:
                 append_log(f"[IMG] downloading: {card_number} -> {dest.name}")
                 await asyncio.to_thread(download_image, image_url, dest)
+                image_index.add(dest.stem)
                 append_log("[IMG] done")
                 if selected_card_number["no"] == card_number:
                     set_image_for_card(card_number, image_url)
@@ -539,7 +756,6 @@ def launch_app(db_path: str) -> None:
             finally:
                 with download_lock:
                     downloading.discard(card_number)
-                page.update()
 
         def ensure_image_download(card_number: str, image_url: str) -> None:
             if not card_number:
@@ -547,9 +763,9 @@ def launch_app(db_path: str) -> None:
                 return
 
             resolved_url = resolve_url((image_url or "").strip())
-            dest = local_image_path(data_root, card_number)
+            dest = card_image_path(card_number)
 
-            if dest.exists():
+            if image_on_disk(dest):
                 set_image_for_card(card_number, resolved_url)
                 return
 
@@ -564,45 +780,59 @@ def launch_app(db_path: str) -> None:
 
             page.run_task(download_selected_image, card_number, resolved_url)
 
+        # 칩 라벨은 십여 종뿐이라 카드마다 새로 만들 이유가 없다. 다만 한 카드에
+        # 같은 라벨이 두 번 나올 수 있어(아츠 2개) 렌더 내 등장 순번까지 키로 쓴다.
+        # 순번은 render_detail이 렌더 시작 시 리셋한다.
+        _section_chips: dict[tuple[str, int], ft.Control] = {}
+        _chip_slots: dict[str, int] = {}
+
         def build_section_chip(text: str) -> ft.Control:
-            return ft.Container(
-                content=ft.Text(text, weight=ft.FontWeight.BOLD, size=12),
-                bgcolor=with_opacity(0.18, COLORS.BLUE_GREY_700),
-                padding=ft.padding.symmetric(horizontal=8, vertical=3),
-                border_radius=12,
-            )
+            slot = _chip_slots.get(text, 0)
+            _chip_slots[text] = slot + 1
+            key = (text, slot)
+            chip = _section_chips.get(key)
+            if chip is None:
+                chip = ft.Container(
+                    content=ft.Text(text, weight=ft.FontWeight.BOLD, size=12),
+                    bgcolor=BG_CHIP,
+                    padding=ft.padding.symmetric(horizontal=8, vertical=3),
+                    border_radius=12,
+                )
+                _section_chips[key] = chip
+            return chip
 
         def build_detail_line(line: str) -> ft.Control:
-            if line in SECTION_LABELS:
+            if line in SECTION_LABEL_SET:
                 return build_section_chip(line)
 
-            for label in SECTION_LABELS:
-                if line.startswith(label + " "):
-                    rest = line[len(label):]
-                    return ft.Text(
-                        spans=[
-                            ft.TextSpan(label, style=ft.TextStyle(weight=ft.FontWeight.BOLD)),
-                            ft.TextSpan(rest),
-                        ]
-                    )
+            label, sep, rest = line.partition(" ")
+            if sep and label in SECTION_LABEL_SET:
+                return ft.Text(
+                    spans=[
+                        ft.TextSpan(label, style=ft.TextStyle(weight=ft.FontWeight.BOLD)),
+                        ft.TextSpan(" " + rest),
+                    ]
+                )
             return ft.Text(line)
 
-        def append_detail_lines(text: str) -> None:
-            lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-            for line in lines:
-                detail_lv.controls.append(build_detail_line(line))
-
         def render_detail() -> None:
-            detail_lv.controls.clear()
+            _chip_slots.clear()
             ko = (detail_texts["ko"] or "").strip()
 
+            # 컨트롤 목록을 로컬에서 다 만든 뒤 한 번에 교체한다.
+            # 중간 상태가 diff에 섞여 나가지 않고 할당도 한 번이다.
             if ko:
-                detail_lv.controls.append(build_section_chip("한국어"))
-                append_detail_lines(ko)
+                controls: list[ft.Control] = [build_section_chip("한국어")]
+                controls.extend(
+                    build_detail_line(ln.strip())
+                    for ln in ko.splitlines()
+                    if ln.strip()
+                )
             else:
-                detail_lv.controls.append(ft.Text("(한국어 본문 없음)"))
+                controls = [ft.Text("(한국어 본문 없음)")]
 
-            page.update()
+            detail_lv.controls = controls
+            request_update()
 
         def set_detail_text(ko_text: str | None) -> None:
             detail_texts["ko"] = (ko_text or "")
@@ -612,116 +842,325 @@ def launch_app(db_path: str) -> None:
             selected_print_id["id"] = None
             selected_card_number["no"] = ""
             selected_image_url["url"] = ""
+            _detail_shown["pid"] = None
             set_detail_text("")
             clear_image("카드를 선택하세요")
 
+        # 키 입력마다 ListTile을 전부 새로 만들지 않도록 타일을 풀에서 재사용한다.
+        _tile_pool: list[ft.ListTile] = []
+
+        def _on_row_click(e) -> None:
+            show_detail(e.control.data)
+
+        def _get_tile(index: int) -> ft.ListTile:
+            if index < len(_tile_pool):
+                return _tile_pool[index]
+            tile = ft.ListTile(
+                title=ft.Text(""),
+                selected_tile_color=with_opacity(0.22, COLORS.BLUE_GREY_700),
+                selected_color=COLORS.WHITE,
+                dense=True,
+                on_click=_on_row_click,
+            )
+            _tile_pool.append(tile)
+            return tile
+
+        _empty_result_banner = ft.Container(
+            content=ft.Text("검색 결과가 없습니다.", color=COLORS.GREY_400),
+            padding=ft.padding.symmetric(horizontal=12, vertical=10),
+        )
+
+        # 마지막으로 그린 (pid, title) 목록. DB 갱신 후 내용이 같으면
+        # 타일을 다시 채우지 않고 선택 플래그만 손본다.
+        _render_snapshot = {"items": None}
+
         def render_result_list() -> None:
-            lv.controls.clear()
             rows = results_state["rows"]
             if not rows:
-                lv.controls.append(
-                    ft.Container(
-                        content=ft.Text("검색 결과가 없습니다.", color=COLORS.GREY_400),
-                        padding=ft.padding.symmetric(horizontal=12, vertical=10),
-                    )
-                )
+                lv.controls = [_empty_result_banner]
+                _render_snapshot["items"] = None
                 return
 
-            for row in rows:
-                pid = row["print_id"]
-                card_number = (row.get("card_number") or "").strip()
-                name_ko = (row.get("name_ko") or "").strip()
-                name_ja = (row.get("name_ja") or "").strip()
-                display_name = name_ko or name_ja or "(이름 없음)"
+            items = []
+            # rows는 (print_id, card_number, name_ja, name_ko, image_url) 튜플.
+            # 키 입력마다 도는 루프라 dict 변환 없이 바로 언팩한다.
+            for pid, card_number, name_ja, name_ko, _url in rows:
+                card_number = (card_number or "").strip()
+                display_name = (name_ko or "").strip() or (name_ja or "").strip() or "(이름 없음)"
                 title = f"{card_number} | {display_name}" if card_number else display_name
-                is_selected = selected_print_id["id"] == pid
-                lv.controls.append(
-                    ft.ListTile(
-                        title=ft.Text(title),
-                        selected=is_selected,
-                        selected_tile_color=with_opacity(0.22, COLORS.BLUE_GREY_700),
-                        selected_color=COLORS.WHITE,
-                        dense=True,
-                        on_click=lambda e, _pid=pid: show_detail(_pid),
-                    )
-                )
+                items.append((pid, title))
 
-        def show_detail(pid: int) -> None:
-            selected_print_id["id"] = pid
-            render_result_list()
+            selected = selected_print_id["id"]
+            if items == _render_snapshot["items"]:
+                for tile in lv.controls:
+                    tile.selected = tile.data == selected
+                return
+            _render_snapshot["items"] = items
+
+            tiles = []
+            for index, (pid, title) in enumerate(items):
+                tile = _get_tile(index)
+                tile.data = pid
+                tile.title.value = title
+                tile.selected = selected == pid
+                tiles.append(tile)
+            lv.controls = tiles
+
+        # 최근 본 카드는 쿼리 없이 바로 띄운다. epoch가 바뀌면(DB 갱신) 자동 무효화.
+        DETAIL_CACHE_MAX = 256
+        detail_cache: dict[tuple[int, int], dict] = {}
+
+        def _fetch_card(pid: int) -> dict | None:
+            key = (conn_epoch["value"], pid)
+            cached = detail_cache.get(key)
+            if cached is not None:
+                return cached
+            with pooled_conn() as conn:
+                card = get_print_with_detail(conn, pid)
+            if card is not None:
+                if len(detail_cache) >= DETAIL_CACHE_MAX:
+                    detail_cache.pop(next(iter(detail_cache)))
+                detail_cache[key] = card
+            return card
+
+        # 같은 행 더블클릭/재탭 시 쿼리-이미지-렌더를 전부 다시 돌리지 않기 위한
+        # "마지막으로 성공 렌더한 상세" 기록. epoch가 바뀌면(DB 갱신) 무효.
+        _detail_shown = {"pid": None, "epoch": None}
+
+        async def show_detail_async(pid: int) -> None:
+            if (
+                _detail_shown["pid"] == pid
+                and _detail_shown["epoch"] == conn_epoch["value"]
+            ):
+                # 패널 내용은 이미 맞다. 목록 하이라이트만 어긋났으면 바로잡는다.
+                if selected_print_id["id"] != pid:
+                    with batch_updates():
+                        selected_print_id["id"] = pid
+                        render_result_list()
+                return
+            with batch_updates():
+                selected_print_id["id"] = pid
+                render_result_list()
 
-            try:
-                conn = get_conn()
-                brief = get_print_brief(conn, pid) or {}
-                selected_card_number["no"] = (brief.get("card_number") or "").strip()
-                selected_image_url["url"] = resolve_url((brief.get("image_url") or "").strip())
-
-                if selected_card_number["no"]:
-                    set_image_for_card(
-                        selected_card_number["no"],
-                        selected_image_url["url"],
-                        loading=True,
-                        placeholder_text="이미지 없음",
-                    )
-                    ensure_image_download(
-                        selected_card_number["no"],
-                        selected_image_url["url"],
-                    )
-                else:
-                    clear_image("이미지 없음")
+                try:
+                    card = await asyncio.to_thread(_fetch_card, pid) or {}
+                    if selected_print_id["id"] != pid:
+                        return
+                    selected_card_number["no"] = (card.get("card_number") or "").strip()
+                    selected_image_url["url"] = resolve_url((card.get("image_url") or "").strip())
+
+                    if selected_card_number["no"]:
+                        set_image_for_card(
+                            selected_card_number["no"],
+                            selected_image_url["url"],
+                            loading=True,
+                            placeholder_text="이미지 없음",
+                        )
+                        ensure_image_download(
+                            selected_card_number["no"],
+                            selected_image_url["url"],
+                        )
+                    else:
+                        clear_image("이미지 없음")
+
+                    set_detail_text(card.get("ko_text") if card else None)
+                    _detail_shown.update({"pid": pid, "epoch": conn_epoch["value"]})
+                    page.run_task(_prefetch_neighbor_images, pid)
 
-                card = load_card_detail(conn, pid)
-                set_detail_text(card.get("ko_text", "") if card else None)
+                except Exception as ex:
+                    set_detail_text(f"[ERROR] 상세 로드 실패: {ex}")
+                    clear_image("이미지 로딩 실패")
 
-            except Exception as ex:
-                set_detail_text(f"[ERROR] 상세 로드 실패: {ex}")
-                clear_image("이미지 로딩 실패")
+        def show_detail(pid: int) -> None:
+            page.run_task(show_detail_async, pid)
+
+        # 타이핑 중 키 입력마다 쿼리가 나가지 않도록 마지막 입력 후 잠깐 기다렸다 실행.
+        # seq 토큰이 갱신되면 진행 중이던 검색 결과는 버린다.
+        search_debounce = {"seq": 0}
+
+        # 키 입력마다 전체 결과를 다 가져오는 대신 첫 페이지만 가져오고,
+        # 스크롤이 바닥에 가까워지면 다음 페이지를 이어 붙인다.
+        SEARCH_PAGE_SIZE = 20
+        page_state = {"done": False, "loading": False}
+
+        # 같은 질의를 다시 치거나 검색 모드를 되돌릴 때 SQL을 또 돌리지 않도록
+        # 페이지 단위 결과를 캐시한다. epoch가 바뀌면(DB 갱신) 키가 달라져 무효화.
+        SEARCH_CACHE_MAX = 128
+        search_cache: dict[tuple, list] = {}
+
+        def _fetch_rows(query: str, mode: str, offset: int = 0) -> list:
+            key = (conn_epoch["value"], mode, query, offset)
+            cached = search_cache.get(key)
+            if cached is not None:
+                return cached
+            with pooled_conn() as conn:
+                if mode == SEARCH_MODE_EXACT:
+                    rows = query_exact(conn, query, limit=SEARCH_PAGE_SIZE, offset=offset)
+                else:
+                    rows = query_suggest(conn, query, limit=SEARCH_PAGE_SIZE, offset=offset)
+            if len(search_cache) >= SEARCH_CACHE_MAX:
+                search_cache.pop(next(iter(search_cache)))
+            search_cache[key] = rows
+            return rows
+
+        async def refresh_list_async(seq: int) -> None:
+            with batch_updates():
+                query = (tf_search.value or "").strip()
+                results_state["rows"] = []
+                selected_print_id["id"] = None
+
+                if not query:
+                    render_result_list()
+                    clear_selection()
+                    return
 
-            page.update()
+                if await asyncio.to_thread(needs_db_update):
+                    append_log("[INFO] DB가 없거나 손상되어 검색 불가. 메뉴에서 DB 수동갱신을 실행하세요.")
+                    show_toast(DB_MISSING_TOAST, persist=True)
+                    render_result_list()
+                    clear_selection()
+                    return
 
-        def refresh_list() -> None:
-            query = (tf_search.value or "").strip()
-            results_state["rows"] = []
-            selected_print_id["id"] = None
+                try:
+                    rows = await asyncio.to_thread(_fetch_rows, query, search_mode_state["value"])
+                    if seq != search_debounce["seq"]:
+                        return
+                    results_state["rows"] = rows
+                    page_state["done"] = len(rows) < SEARCH_PAGE_SIZE
+                    render_result_list()
+                    if rows:
+                        page.run_task(_prefetch_result_images, rows, seq)
+                        await show_detail_async(rows[0][0])
+                    else:
+                        clear_selection()
+                except Exception as ex:
+                    message = f"검색 실패: {ex}"
+                    append_log("[ERROR] " + message)
+                    update_status.value = message
+                    update_status.visible = True
+                    update_status.color = COLORS.RED_300
+                    render_result_list()
+                    clear_selection()
 
-            if not query:
-                render_result_list()
-                clear_selection()
-                page.update()
-                return
+        def refresh_list() -> None:
+            search_debounce["seq"] += 1
+            page.run_task(refresh_list_async, search_debounce["seq"])
 
-            if needs_db_update():
-                append_log("[INFO] DB가 없거나 손상되어 검색 불가. 메뉴에서 DB 수동갱신을 실행하세요.")
-                show_toast(DB_MISSING_TOAST, persist=True)
-                render_result_list()
-                clear_selection()
-                page.update()
+        async def _load_more_results(seq: int) -> None:
+            if page_state["loading"] or page_state["done"]:
                 return
+            page_state["loading"] = True
+            try:
+                query = (tf_search.value or "").strip()
+                if not query:
+                    return
+                offset = len(results_state["rows"])
+                rows = await asyncio.to_thread(
+                    _fetch_rows, query, search_mode_state["value"], offset
+                )
+                if seq != search_debounce["seq"]:
+                    return
+                if len(rows) < SEARCH_PAGE_SIZE:
+                    page_state["done"] = True
+                if rows:
+                    results_state["rows"] = results_state["rows"] + rows
+                    render_result_list()
+                    request_update()
+            finally:
+                page_state["loading"] = False
 
+        def on_list_scroll(e) -> None:
             try:
-                conn = get_conn()
-                if search_mode_state["value"] == SEARCH_MODE_EXACT:
-                    results_state["rows"] = query_exact(conn, query)
-                else:
-                    results_state["rows"] = query_suggest(conn, query)
-                render_result_list()
-                if results_state["rows"]:
-                    show_detail(results_state["rows"][0]["print_id"])
-                else:
-                    clear_selection()
-            except Exception as ex:
-                message = f"검색 실패: {ex}"
-                append_log(f"[ERROR] {message}")
-                update_status.value = message
-                update_status.visible = True
-                update_status.color = COLORS.RED_300
-                render_result_list()
-                clear_selection()
+                if e.pixels >= e.max_scroll_extent - 200:
+                    page.run_task(_load_more_results, search_debounce["seq"])
+            except Exception:
+                pass
 
-            page.update()
+        lv.on_scroll = on_list_scroll
+
+        # 검색 직후 상위 결과 이미지를 미리 받아두면 목록 이동 시 바로 뜬다.
+        PREFETCH_LIMIT = 8
+
+        async def _prefetch_result_images(rows: list, seq: int) -> None:
+            sem = asyncio.Semaphore(4)
+
+            async def _fetch_one(card_number: str, url: str) -> None:
+                async with sem:
+                    if seq != search_debounce["seq"]:
+                        return
+                    dest = card_image_path(card_number)
+                    if image_on_disk(dest):
+                        return
+                    with download_lock:
+                        if card_number in downloading:
+                            return
+                        downloading.add(card_number)
+                    try:
+                        await asyncio.to_thread(download_image, url, dest)
+                        image_index.add(dest.stem)
+                        if selected_card_number["no"] == card_number:
+                            set_image_for_card(card_number, url)
+                    except Exception:
+                        pass
+                    finally:
+                        with download_lock:
+                            downloading.discard(card_number)
+
+            tasks = []
+            for _pid, card_number, _ja, _ko, image_url in rows[:PREFETCH_LIMIT]:
+                card_number = (card_number or "").strip()
+                url = resolve_url((image_url or "").strip())
+                if card_number and url:
+                    tasks.append(_fetch_one(card_number, url))
+            if tasks:
+                await asyncio.gather(*tasks)
+
+        # 타일을 누른 뒤 바로 위/아래 타일로 이동하는 패턴이 흔하다.
+        # 선택 시점에 이웃 카드 이미지를 미리 받아 두면 다음 전환이 즉시 뜬다.
+        async def _prefetch_neighbor_images(pid: int) -> None:
+            rows = results_state["rows"]
+            idx = next((i for i, row in enumerate(rows) if row[0] == pid), None)
+            if idx is None:
+                return
+
+            async def _fetch_one(card_number: str, url: str) -> None:
+                dest = card_image_path(card_number)
+                if image_on_disk(dest):
+                    return
+                with download_lock:
+                    if card_number in downloading:
+                        return
+                    downloading.add(card_number)
+                try:
+                    await asyncio.to_thread(download_image, url, dest)
+                    image_index.add(dest.stem)
+                except Exception:
+                    pass
+                finally:
+                    with download_lock:
+                        downloading.discard(card_number)
+
+            tasks = []
+            for i in (idx - 1, idx + 1):
+                if not 0 <= i < len(rows):
+                    continue
+                _npid, card_number, _ja, _ko, image_url = rows[i]
+                card_number = (card_number or "").strip()
+                url = resolve_url((image_url or "").strip())
+                if card_number and url:
+                    tasks.append(_fetch_one(card_number, url))
+            if tasks:
+                await asyncio.gather(*tasks)
+
+        async def _debounced_refresh(seq: int) -> None:
+            await asyncio.sleep(SEARCH_DEBOUNCE_S)
+            if seq != search_debounce["seq"]:
+                return
+            await refresh_list_async(seq)
 
         def on_search_change(e) -> None:
-            refresh_list()
+            search_debounce["seq"] += 1
+            page.run_task(_debounced_refresh, search_debounce["seq"])
 
         tf_search.on_change = on_search_change
         tf_search.on_submit = on_search_change
@@ -736,6 +1175,10 @@ def launch_app(db_path: str) -> None:
             refresh_list()
 
         def on_db_change(e) -> None:
+            # 경로가 바뀌면 epoch 기반 캐시(검색 페이지/상세/상세 표시 마커)도
+            # 이전 DB의 결과를 그대로 들고 있으므로 epoch를 올려 전부 무효화한다.
+            # 커넥션 풀은 경로 키로도 걸러지지만 캐시 키에는 epoch만 들어간다.
+            conn_epoch["value"] += 1
             invalidate_db_health_cache()
             update_prompt_state["shown"] = False
 
@@ -755,13 +1198,19 @@ def launch_app(db_path: str) -> None:
             update_status.visible = bool(text)
             update_status.color = COLORS.RED_300 if is_error else COLORS.GREEN_300
 
-        def run_update_pipeline_blocking(dbp: str) -> None:
-            for line in run_update_and_refine(dbp):
-                append_log(line)
+        update_lock = asyncio.Lock()
 
         async def do_update_async() -> None:
-            if update_state["running"]:
+            # 더블클릭 등으로 두 태스크가 동시에 진입해도 한 번만 실행.
+            if update_lock.locked():
                 return
+            async with update_lock:
+                await _do_update_locked()
+
+        async def _do_update_locked() -> None:
+            # pipeline은 urllib/subprocess까지 끌고 오므로 첫 프레임 전에 로드하지
+            # 않는다. 첫 호출 이후엔 모듈 캐시라 비용 없음.
+            from app.services.pipeline import run_update_and_refine_async
 
             dbp = (tf_db.value or "").strip()
             if not dbp:
@@ -777,12 +1226,15 @@ def launch_app(db_path: str) -> None:
                 page.update()
 
                 append_log("[START] DB 갱신")
-                await asyncio.to_thread(run_update_pipeline_blocking, dbp)
+                async for line in run_update_and_refine_async(dbp):
+                    append_log(line)
                 append_log("[DONE] DB 갱신")
 
                 conn_epoch["value"] += 1
-                close_thread_conn()
+                drain_conn_pool()
                 invalidate_db_health_cache()
+                # 풀이 비워졌으니 다음 검색이 콜드 오픈을 떠안지 않게 미리 덥힌다.
+                page.run_task(_prewarm_db_async)
 
                 set_update_status("DB 갱신 완료")
                 show_toast(
@@ -793,7 +1245,7 @@ def launch_app(db_path: str) -> None:
                 refresh_list()
             except Exception as ex:
                 message = f"DB 갱신 실패: {ex}"
-                append_log(f"[ERROR] {message}")
+                append_log("[ERROR] " + message)
                 set_update_status(message, is_error=True)
                 show_toast(message, duration_ms=4000, restore_missing_after=True)
                 if needs_db_update():
@@ -821,7 +1273,22 @@ def launch_app(db_path: str) -> None:
             ),
         )
 
-        db_update_dialog = ft.AlertDialog(modal=True)
+        db_update_local_text = ft.Text("", size=12, color=COLORS.GREY_400)
+        db_update_remote_text = ft.Text("", size=12, color=COLORS.GREY_400)
+        db_update_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("DB 업데이트"),
+            content=ft.Column(
+                [
+                    ft.Text("DB 업데이트가 있습니다. 업데이트 하시겠습니까?"),
+                    db_update_local_text,
+                    db_update_remote_text,
+                ],
+                tight=True,
+                spacing=6,
+            ),
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
         btn_manual_update = ft.ElevatedButton(
             "DB 수동갱신",
             icon=ICONS.SYNC,
@@ -855,20 +1322,26 @@ def launch_app(db_path: str) -> None:
         page.end_drawer = menu_panel
 
         async def close_menu_panel_async() -> None:
+            if not update_state["menu_open"]:
+                return
             try:
                 await page.close_end_drawer()
             except Exception:
                 pass
+            update_state["menu_open"] = False
 
         async def open_menu_panel_async() -> None:
             if update_state["running"]:
                 return
-            search_mode_group.value = search_mode_state["value"]
-            page.update()
+            if search_mode_group.value != search_mode_state["value"]:
+                search_mode_group.value = search_mode_state["value"]
+                page.update()
             try:
                 await page.show_end_drawer()
             except Exception as ex:
                 append_log(f"[ERROR] 메뉴 패널 열기 실패: {ex}")
+                return
+            update_state["menu_open"] = True
 
         async def run_manual_update_from_panel_async() -> None:
             await close_menu_panel_async()
@@ -887,23 +1360,15 @@ def launch_app(db_path: str) -> None:
             close_db_update_dialog()
             page.run_task(do_update_async)
 
+        db_update_dialog.actions = [
+            ft.TextButton("나중에", on_click=close_db_update_dialog),
+            ft.ElevatedButton("업데이트", on_click=on_db_update_confirm),
+        ]
+
         def open_db_update_dialog(local_date_value: str | None, remote_date_value: str) -> None:
             local_label = local_date_value or "없음"
-            db_update_dialog.title = ft.Text("DB 업데이트")
-            db_update_dialog.content = ft.Column(
-                [
-                    ft.Text("DB 업데이트가 있습니다. 업데이트 하시겠습니까?"),
-                    ft.Text(f"로컬 DB 날짜: {local_label}", size=12, color=COLORS.GREY_400),
-                    ft.Text(f"GitHub DB 날짜: {remote_date_value}", size=12, color=COLORS.GREY_400),
-                ],
-                tight=True,
-                spacing=6,
-            )
-            db_update_dialog.actions = [
-                ft.TextButton("나중에", on_click=close_db_update_dialog),
-                ft.ElevatedButton("업데이트", on_click=on_db_update_confirm),
-            ]
-            db_update_dialog.actions_alignment = ft.MainAxisAlignment.END
+            db_update_local_text.value = f"로컬 DB 날짜: {local_label}"
+            db_update_remote_text.value = f"GitHub DB 날짜: {remote_date_value}"
             if db_update_dialog.open:
                 return
             page.show_dialog(db_update_dialog)
@@ -916,21 +1381,20 @@ def launch_app(db_path: str) -> None:
             if not dbp:
                 return
 
-            def _resolve_dates(path_value: str) -> tuple[str | None, str | None]:
-                local_date_value = local_db_date(path_value)
-                info = get_latest_release_db_info()
-                if not info:
-                    return local_date_value, None
-                remote_date_value = format_iso_date(
-                    info.get("asset_updated_at")
-                    or info.get("published_at")
-                    or info.get("created_at")
-                )
-                return local_date_value, remote_date_value
+            from app.services.pipeline import get_latest_release_db_info
 
-            local_date_value, remote_date_value = await asyncio.to_thread(_resolve_dates, dbp)
+            info = await asyncio.to_thread(get_latest_release_db_info)
+            if not info:
+                return
+            # 날짜 파싱은 순수 파이썬이라 스레드 홉 없이 루프에서 처리.
+            remote_date_value = format_iso_date(
+                info.get("asset_updated_at")
+                or info.get("published_at")
+                or info.get("created_at")
+            )
             if not remote_date_value:
                 return
+            local_date_value = await asyncio.to_thread(local_db_date, dbp)
             if local_date_value == remote_date_value:
                 return
 
@@ -945,7 +1409,7 @@ def launch_app(db_path: str) -> None:
         btn_menu.on_click = on_menu_click
 
         # --- first-run: 초기 렌더 속도를 위해 DB open/init은 지연 ---
-        if not db_exists(tf_db.value):
+        if not db_exists_cached(tf_db.value):
             if not tf_db.value or not tf_db.value.strip():
                 append_log("[WARN] DB 경로가 비어있습니다. 상단 DB 경로를 지정해주세요.")
             else:
@@ -958,16 +1422,6 @@ def launch_app(db_path: str) -> None:
         def image_toggle_label() -> str:
             return "이미지 펼치기" if image_panel_state["collapsed"] else "이미지 접기"
 
-        def image_section_header_mobile() -> ft.Control:
-            return ft.Row(
-                [
-                    ft.Text("이미지"),
-                    ft.TextButton(image_toggle_label(), on_click=toggle_image_panel),
-                ],
-                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                vertical_alignment=ft.CrossAxisAlignment.CENTER,
-            )
-
         def toggle_image_panel(e=None) -> None:
             image_panel_state["collapsed"] = not image_panel_state["collapsed"]
             build_layout(force=True)
@@ -983,9 +1437,13 @@ def launch_app(db_path: str) -> None:
                     is_android = True
 
             user_agent = (getattr(page, "client_user_agent", "") or "").lower()
-            ua_android = "android" in user_agent
-            ua_mobile = "mobile" in user_agent
-            ua_tablet_hint = "tablet" in user_agent or (ua_android and not ua_mobile)
+            hits = set(_UA_HINT_RE.findall(user_agent))
+            ua_android = "android" in hits
+            if not is_android and not ua_android:
+                # 안드로이드가 아니면 사이즈 계산까지 갈 필요 없음.
+                return False
+            ua_mobile = "mobile" in hits
+            ua_tablet_hint = "tablet" in hits or (ua_android and not ua_mobile)
 
             width, height = get_view_size()
             min_dim = min([dim for dim in (width, height) if dim]) if width or height else 0
@@ -1007,88 +1465,15 @@ def launch_app(db_path: str) -> None:
             scaled = int(height * ratio)
             return max(min_px, min(max_px, scaled))
 
-        def build_layout(force: bool = False) -> None:
-            mobile = is_mobile_layout()
-            width, height = get_view_size()
-            size_key = (int(width or 0), int(height or 0))
-            if (
-                not force
-                and layout_state["mobile"] == mobile
-                and layout_state["size"] == size_key
-            ):
-                return
-            layout_state["mobile"] = mobile
-            layout_state["size"] = size_key
-
-            page.controls.clear()
-
-            if mobile:
-                lv.expand = True
-                lv.scroll = ft.ScrollMode.AUTO
-                detail_lv.expand = False
-                detail_lv.scroll = None
-                list_height = mobile_scaled_height(0.30, 190, 360)
-                image_height = mobile_scaled_height(0.45, 240, 560)
+        # 리사이즈마다 트리를 새로 만들지 않도록 두 레이아웃은 한 번만 조립하고,
+        # 이후에는 높이/접힘 같은 가변 속성만 고쳐 쓴다.
+        layout_cache: dict[str, ft.Control | None] = {"desktop": None, "mobile": None}
+        mobile_widgets: dict[str, ft.Control] = {}
 
-                top_row = ft.Row(
-                    [
-                        tf_search,
-                        btn_menu,
-                    ],
-                    spacing=8,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                )
-
-                mobile_root = ft.Column(
-                    [
-                        top_row,
-                        update_status,
-                        ft.Divider(height=1),
-                        ft.Text("목록"),
-                        ft.Container(
-                            content=lv,
-                            height=list_height,
-                            padding=10,
-                            border=ft.border.all(1, with_opacity(0.15, COLORS.WHITE)),
-                            border_radius=10,
-                        ),
-                        image_section_header_mobile(),
-                        ft.Text("이미지를 접었습니다.", color=COLORS.GREY_400)
-                        if image_panel_state["collapsed"]
-                        else ft.Container(
-                            content=img_container,
-                            height=image_height,
-                            border=ft.border.all(1, with_opacity(0.15, COLORS.WHITE)),
-                            border_radius=10,
-                        ),
-                        ft.Text("효과"),
-                        ft.Container(
-                            content=detail_lv,
-                            padding=10,
-                            border=ft.border.all(1, with_opacity(0.15, COLORS.WHITE)),
-                            border_radius=10,
-                        ),
-                    ],
-                    expand=True,
-                    spacing=8,
-                    scroll=ft.ScrollMode.AUTO,
-                )
-
-                page.add(
-                    ft.SafeArea(
-                        content=ft.Container(
-                            content=mobile_root,
-                            padding=ft.padding.only(left=10, right=10, top=6, bottom=10),
-                        ),
-                        expand=True,
-                    )
-                )
-                return
-
-            lv.expand = True
-            lv.scroll = ft.ScrollMode.AUTO
-            detail_lv.expand = True
-            detail_lv.scroll = ft.ScrollMode.AUTO
+        def _build_desktop_view() -> ft.Control:
+            cached = layout_cache["desktop"]
+            if cached is not None:
+                return cached
 
             top = ft.Row(
                 [
@@ -1101,7 +1486,7 @@ def launch_app(db_path: str) -> None:
 
             left = ft.Column(
                 [
-                    ft.Container(ft.Text("목록"), padding=ft.padding.only(left=10, top=4)),
+                    ft.Container(ft.Text("목록"), padding=PAD_PANEL_LABEL),
                     ft.Container(lv, expand=True, padding=10),
                 ],
                 expand=True,
@@ -1110,7 +1495,7 @@ def launch_app(db_path: str) -> None:
 
             middle = ft.Column(
                 [
-                    ft.Container(ft.Text("이미지"), padding=ft.padding.only(left=10, top=4)),
+                    ft.Container(ft.Text("이미지"), padding=PAD_PANEL_LABEL),
                     img_container,
                 ],
                 expand=True,
@@ -1119,23 +1504,23 @@ def launch_app(db_path: str) -> None:
 
             right = ft.Column(
                 [
-                    ft.Container(ft.Text("효과"), padding=ft.padding.only(left=10, top=4)),
+                    ft.Container(ft.Text("효과"), padding=PAD_PANEL_LABEL),
                     ft.Container(detail_lv, expand=True, padding=10),
                 ],
                 expand=True,
                 spacing=0,
             )
 
-            body_controls: list[ft.Control] = [ft.Container(left, expand=3)]
-            body_controls.extend(
+            body = ft.Row(
                 [
+                    ft.Container(left, expand=3),
                     ft.VerticalDivider(width=1),
                     ft.Container(middle, expand=6),
                     ft.VerticalDivider(width=1),
                     ft.Container(right, expand=4),
-                ]
+                ],
+                expand=True,
             )
-            body = ft.Row(body_controls, expand=True)
 
             desktop_root = ft.Column(
                 [
@@ -1149,25 +1534,153 @@ def launch_app(db_path: str) -> None:
                 spacing=8,
             )
 
-            page.add(
-                ft.SafeArea(
+            view = ft.SafeArea(
+                content=ft.Container(
+                    content=desktop_root,
+                    padding=PAD_ROOT,
+                ),
+                expand=True,
+            )
+            layout_cache["desktop"] = view
+            return view
+
+        def _build_mobile_view() -> ft.Control:
+            cached = layout_cache["mobile"]
+            if cached is None:
+                toggle_btn = ft.TextButton(image_toggle_label(), on_click=toggle_image_panel)
+                header = ft.Row(
+                    [
+                        ft.Text("이미지"),
+                        toggle_btn,
+                    ],
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                )
+                top_row = ft.Row(
+                    [
+                        tf_search,
+                        btn_menu,
+                    ],
+                    spacing=8,
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                )
+                list_panel = build_panel(lv)
+                image_panel = build_panel(img_container, padding=None)
+                collapsed_text = ft.Text("이미지를 접었습니다.", color=COLORS.GREY_400)
+                image_slot = ft.Container(content=image_panel)
+
+                mobile_root = ft.Column(
+                    [
+                        top_row,
+                        update_status,
+                        ft.Divider(height=1),
+                        ft.Text("목록"),
+                        list_panel,
+                        header,
+                        image_slot,
+                        ft.Text("효과"),
+                        build_panel(detail_lv),
+                    ],
+                    expand=True,
+                    spacing=8,
+                    scroll=ft.ScrollMode.AUTO,
+                )
+
+                cached = ft.SafeArea(
                     content=ft.Container(
-                        content=desktop_root,
-                        padding=ft.padding.only(left=10, right=10, top=6, bottom=10),
+                        content=mobile_root,
+                        padding=PAD_ROOT,
                     ),
                     expand=True,
                 )
+                mobile_widgets.update(
+                    toggle=toggle_btn,
+                    list_panel=list_panel,
+                    image_panel=image_panel,
+                    collapsed_text=collapsed_text,
+                    image_slot=image_slot,
+                )
+                layout_cache["mobile"] = cached
+
+            # 크기·접힘 상태에 따라 달라지는 속성만 갱신
+            mobile_widgets["list_panel"].height = mobile_scaled_height(0.30, 190, 360)
+            mobile_widgets["image_panel"].height = mobile_scaled_height(0.45, 240, 560)
+            mobile_widgets["toggle"].text = image_toggle_label()
+            mobile_widgets["image_slot"].content = (
+                mobile_widgets["collapsed_text"]
+                if image_panel_state["collapsed"]
+                else mobile_widgets["image_panel"]
             )
+            return cached
+
+        def build_layout(force: bool = False) -> None:
+            mobile = is_mobile_layout()
+            width, height = get_view_size()
+            size_key = (int(width or 0), int(height or 0))
+            if (
+                not force
+                and layout_state["mobile"] == mobile
+                and layout_state["size"] == size_key
+            ):
+                return
+            same_mode = layout_state["mobile"] == mobile and bool(page.controls)
+            layout_state["mobile"] = mobile
+            layout_state["size"] = size_key
+
+            if mobile:
+                lv.expand = True
+                lv.scroll = ft.ScrollMode.AUTO
+                detail_lv.expand = False
+                detail_lv.scroll = None
+                view = _build_mobile_view()
+            else:
+                lv.expand = True
+                lv.scroll = ft.ScrollMode.AUTO
+                detail_lv.expand = True
+                detail_lv.scroll = ft.ScrollMode.AUTO
+                view = _build_desktop_view()
+
+            if same_mode:
+                # 같은 모드의 리사이즈/토글은 속성 변경만 내보내면 된다.
+                request_update()
+                return
+
+            page.controls.clear()
+            page.add(view)
+
+        # 첫 검색이 콜드 페이지 적재 비용을 떠안지 않도록 백그라운드에서
+        # 커넥션을 하나 열어 두고 핫 인덱스/테이블을 미리 훑는다.
+        def _prewarm_db() -> None:
+            # 건강한 DB가 있을 때만. 없는데 열면 open_db→ensure_db가 경로에
+            # 빈 스키마 DB(와 WAL 부산물)를 만들어 버린다 — first-run은
+            # DB open/init을 지연한다는 원칙 그대로 둔다.
+            if needs_db_update():
+                return
+            try:
+                with pooled_conn() as conn:
+                    conn.execute("SELECT COUNT(*) FROM prints").fetchone()
+                    conn.execute(
+                        "SELECT print_id, card_number FROM prints ORDER BY card_number LIMIT 5000"
+                    ).fetchall()
+            except Exception:
+                # 경합으로 방금 깨졌어도 검색 경로가 어차피 안내를 띄운다.
+                pass
+
+        async def _prewarm_db_async() -> None:
+            await asyncio.to_thread(_prewarm_db)
 
         def on_resize(e) -> None:
             build_layout()
 
         page.on_resize = on_resize
+        page.run_task(_ui_flusher)
+        page.run_task(_build_image_index)
         clear_selection()
         render_result_list()
         build_layout()
         page.run_task(run_startup_checks_async)
         page.run_task(check_remote_db_update_async)
+        page.run_task(_prewarm_db_async)
         if needs_db_update():
             show_toast(DB_MISSING_TOAST, persist=True)
 